@@ -47,6 +47,34 @@ def test_make_coords_2d():
     )
 
 
+def test_uniform_coords_shifted_domain():
+    grid_1d = td.UniformGrid(dl=0.1)
+    box = td.Box(size=(1, 1, 1))
+
+    def make_coords(center):
+        structures = [td.Structure(geometry=box.updated_copy(center=center), medium=td.Medium())]
+        return grid_1d.make_coords(
+            axis=0,
+            structures=structures,
+            symmetry=(0, 0, 0),
+            periodic=True,
+            wavelength=1.0,
+            num_pml_layers=(0, 0),
+        )
+
+    coords = make_coords((0, 0, 0))
+    assert np.allclose(coords, np.linspace(-0.5, 0.5, 11))
+
+    # same size at a different center only shifts the coords
+    coords_shifted = make_coords((2, 0, 0))
+    assert np.allclose(coords_shifted, coords + 2)
+
+    # returned coords can be modified without affecting later calls
+    assert coords.flags.writeable
+    coords[:] = 0
+    assert np.allclose(make_coords((0, 0, 0)), np.linspace(-0.5, 0.5, 11))
+
+
 def test_wvl_from_sources():
     # no sources
     with pytest.raises(SetupError):
@@ -3,14 +3,16 @@ from __future__ import annotations
 
 from abc import ABC, abstractmethod
 from typing import Tuple, List, Union
+from math import isclose
+from functools import lru_cache
 
 import numpy as np
 import pydantic.v1 as pd
 
 from .grid import Coords1D, Coords, Grid
 from .mesher import GradedMesher, MesherType
-from ..base import Tidy3dBaseModel
-from ..types import Axis, Symmetry, annotate_type, TYPE_TAG_STR
+from ..base import Tidy3dBaseModel, cached_property
+from ..types import Axis, Symmetry, ArrayFloat1D, annotate_type, TYPE_TAG_STR
 from ..source import SourceType
 from ..structure import Structure, StructureType
 from ..geometry.base import Box
@@ -19,6 +21,30 @@ from ...exceptions import SetupError
 from ...constants import MICROMETER, C_0, fp_eps
 
 
+# number of distinct uniform coordinate arrays kept in memory
+_UNIFORM_COORDS_CACHE_SIZE = 128
+
+
+@lru_cache(maxsize=_UNIFORM_COORDS_CACHE_SIZE)
+def _uniform_coords_offsets(size: float, dl: float) -> Coords1D:
+    """Uniform 1D coords spanning ``size`` starting from zero, with step size close to ``dl``.
+    They do not depend on the position of the domain, so they are cached and shared between
+    domains of equal size. The result is marked read-only, so it must be copied before modifying."""
+
+    # Take a number of steps commensurate with the size; make dl a bit smaller if needed
+    num_cells = int(np.ceil(size / dl))
+
+    # Make sure there's at least one cell
+    num_cells = max(num_cells, 1)
+
+    # Adjust step size to fit simulation size exactly
+    dl_snapped = size / num_cells if size > 0 else dl
+
+    offsets = np.arange(num_cells + 1) * dl_snapped
+    offsets.setflags(write=False)
+    return offsets
+
+
 class GridSpec1d(Tidy3dBaseModel, ABC):
 
     """Abstract base class, defines 1D grid generation specifications."""
@@ -55,6 +81,31 @@ class GridSpec1d(Tidy3dBaseModel, ABC):
             1D coords to be used as grid boundaries.
         """
 
+        return self._make_coords(
+            axis=axis,
+            structures=structures,
+            symmetry=symmetry,
+            periodic=periodic,
+            wavelength=wavelength,
+            num_pml_layers=num_pml_layers,
+        )
+
+    def _make_coords(
+        self,
+        axis: Axis,
+        structures: List[StructureType],
+        symmetry: Tuple[Symmetry, Symmetry, Symmetry],
+        periodic: bool,
+        wavelength: pd.PositiveFloat,
+        num_pml_layers: Tuple[pd.NonNegativeInt, pd.NonNegativeInt],
+        symmetry_structures: List[StructureType] = None,
+    ) -> Coords1D:
+        """Implementation of :meth:`make_coords`. ``symmetry_structures`` is the output of
+        :meth:`AutoGrid._structures_in_symmetry_domain` for the same ``structures`` and
+        ``symmetry``, computed once in :meth:`GridSpec.make_grid` and shared by all axes.
+        It is only used by :class:`AutoGrid`, which computes it itself if ``None``.
+        """
+
         # Determine if one should apply periodic boundary condition.
         # This should only affect auto nonuniform mesh generation for now.
         is_periodic = periodic and symmetry[axis] == 0
@@ -66,16 +117,20 @@ class GridSpec1d(Tidy3dBaseModel, ABC):
             wavelength=wavelength,
             symmetry=symmetry,
             is_periodic=is_periodic,
+            symmetry_structures=symmetry_structures,
         )
 
         # incorporate symmetries
         if symmetry[axis] != 0:
             # Offset to center if symmetry present
             center = structures[0].geometry.center[axis]
-            center_ind = np.argmin(np.abs(center - bound_coords))
-            bound_coords += center - bound_coords[center_ind]
-            bound_coords = bound_coords[bound_coords >= center]
-            bound_coords = np.append(2 * center - bound_coords[:0:-1], bound_coords)
+            # bound_coords is sorted, so the closest coord to the center is one of the two
+            # coords around its insertion index (the lower one in case of a tie)
+            ind = np.clip(np.searchsorted(bound_coords, center), 1, bound_coords.size - 1)
+            center_ind = ind - int(bound_coords[ind] - center >= center - bound_coords[ind - 1])
+            # shift the coords at and above the center and mirror them to the other side
+            bound_coords = bound_coords[center_ind:] + (center - bound_coords[center_ind])
+            bound_coords = np.concatenate((2 * center - bound_coords[:0:-1], bound_coords))
 
         # Add PML layers in using dl on edges
         bound_coords = self._add_pml_to_bounds(num_pml_layers, bound_coords)
@@ -183,17 +238,7 @@ class UniformGrid(GridSpec1d):
         """
 
         center, size = structures[0].geometry.center[axis], structures[0].geometry.size[axis]
-
-        # Take a number of steps commensurate with the size; make dl a bit smaller if needed
-        num_cells = int(np.ceil(size / self.dl))
-
-        # Make sure there's at least one cell
-        num_cells = max(num_cells, 1)
-
-        # Adjust step size to fit simulation size exactly
-        dl_snapped = size / num_cells if size > 0 else self.dl
-
-        return center - size / 2 + np.arange(num_cells + 1) * dl_snapped
+        return center - size / 2 + _uniform_coords_offsets(size, self.dl)
 
 
 class CustomGrid(GridSpec1d):
@@ -225,6 +270,13 @@ class CustomGrid(GridSpec1d):
         units=MICROMETER,
     )
 
+    @cached_property
+    def _dl_array(self) -> ArrayFloat1D:
+        """Custom grid sizes as a read-only float array, converted once per instance."""
+        dl = np.array(self.dl, dtype=float)
+        dl.setflags(write=False)
+        return dl
+
     def _make_coords_initial(
         self,
         axis: Axis,
@@ -251,8 +303,10 @@ class CustomGrid(GridSpec1d):
         center, size = structures[0].geometry.center[axis], structures[0].geometry.size[axis]
 
         # get bounding coordinates
-        dl = np.array(self.dl)
-        bound_coords = np.append(0.0, np.cumsum(dl))
+        dl = self._dl_array
+        bound_coords = np.empty(dl.size + 1)
+        bound_coords[0] = 0.0
+        np.cumsum(dl, out=bound_coords[1:])
 
         # place the middle of the bounds at the center of the simulation along dimension,
         # or use the `custom_offset` if provided
@@ -284,16 +338,19 @@ class CustomGrid(GridSpec1d):
             return bound_coords[ind - 1 : ind + 1]
 
         else:
-            bound_coords = bound_coords[bound_coords <= bound_max]
-            bound_coords = bound_coords[bound_coords >= bound_min]
+            # bound_coords is sorted, so the coords within bounds form a contiguous slice
+            ind_min = np.searchsorted(bound_coords, bound_min, side="left")
+            ind_max = np.searchsorted(bound_coords, bound_max, side="right")
+            bound_coords = bound_coords[ind_min:ind_max]
 
             # if not extending to simulation bounds, repeat beginning and end
             dl_min = dl[0]
             dl_max = dl[-1]
-            while bound_coords[0] - dl_min >= bound_min:
-                bound_coords = np.insert(bound_coords, 0, bound_coords[0] - dl_min)
-            while bound_coords[-1] + dl_max <= bound_max:
-                bound_coords = np.append(bound_coords, bound_coords[-1] + dl_max)
+            num_left = int(np.floor((bound_coords[0] - bound_min) / dl_min))
+            num_right = int(np.floor((bound_max - bound_coords[-1]) / dl_max))
+            add_left = bound_coords[0] - dl_min * np.arange(num_left, 0, -1)
+            add_right = bound_coords[-1] + dl_max * np.arange(1, num_right + 1)
+            bound_coords = np.concatenate((add_left, bound_coords, add_right))
 
             # in case a `custom_offset` is provided, it's possible the bounds were numerically within
             # the simulation bounds but were still chopped off, which is fixed here
@@ -360,6 +417,43 @@ class AutoGrid(GridSpec1d):
         description="The type of mesher to use to generate the grid automatically.",
     )
 
+    @staticmethod
+    def _structures_in_symmetry_domain(
+        structures: List[StructureType], symmetry: Tuple[Symmetry, Symmetry, Symmetry]
+    ) -> List[StructureType]:
+        """Reduce the simulation domain according to symmetry and keep only the structures
+        intersecting it. The result does not depend on the axis, so it can be computed once and
+        shared by the :class:`AutoGrid` specifications along all three axes.
+
+        Parameters
+        ----------
+        structures : List[StructureType]
+            List of structures present in simulation, the first one being the simulation domain.
+        symmetry : Tuple[Symmetry, Symmetry, Symmetry]
+            Reflection symmetry across a plane bisecting the simulation domain
+            normal to each of the three axes.
+
+        Returns
+        -------
+        List[StructureType]
+            List of structures, the first one being the simulation domain reduced by symmetry.
+        """
+
+        sim_cent = list(structures[0].geometry.center)
+        sim_size = list(structures[0].geometry.size)
+        for dim, sym in enumerate(symmetry):
+            if sym != 0:
+                sim_cent[dim] += sim_size[dim] / 4
+                sim_size[dim] /= 2
+        symmetry_domain = Box(center=sim_cent, size=sim_size)
+
+        # New list of structures with symmetry applied
+        struct_list = [Structure(geometry=symmetry_domain, medium=structures[0].medium)]
+        for structure in structures[1:]:
+            if symmetry_domain.intersects(structure.geometry):
+                struct_list.append(structure)
+        return struct_list
+
     def _make_coords_initial(
         self,
         axis: Axis,
@@ -367,6 +461,7 @@ class AutoGrid(GridSpec1d):
         wavelength: float,
         symmetry: Symmetry,
         is_periodic: bool,
+        symmetry_structures: List[StructureType] = None,
     ) -> Coords1D:
         """Customized 1D coords to be used as grid boundaries.
 
@@ -383,6 +478,8 @@ class AutoGrid(GridSpec1d):
             normal to each of the three axes.
         is_periodic : bool
             Apply periodic boundary condition or not.
+        symmetry_structures : List[StructureType] = None
+            Structures reduced to the symmetry domain. Computed from ``structures`` if ``None``.
 
         Returns
         -------
@@ -390,19 +487,12 @@ class AutoGrid(GridSpec1d):
             1D coords to be used as grid boundaries.
         """
 
-        sim_cent = list(structures[0].geometry.center)
-        sim_size = list(structures[0].geometry.size)
-        for dim, sym in enumerate(symmetry):
-            if sym != 0:
-                sim_cent[dim] += sim_size[dim] / 4
-                sim_size[dim] /= 2
-        symmetry_domain = Box(center=sim_cent, size=sim_size)
-
         # New list of structures with symmetry applied
-        struct_list = [Structure(geometry=symmetry_domain, medium=structures[0].medium)]
-        for structure in structures[1:]:
-            if symmetry_domain.intersects(structure.geometry):
-                struct_list.append(structure)
+        struct_list = symmetry_structures
+        if struct_list is None:
+            struct_list = self._structures_in_symmetry_domain(structures, symmetry)
+        symmetry_domain = struct_list[0].geometry
+        sim_cent = symmetry_domain.center
 
         # parse structures
         interval_coords, max_dl_list = self.mesher.parse_structures(
@@ -425,8 +515,11 @@ class AutoGrid(GridSpec1d):
             max_dl_list, len_interval_list, self.max_scale, is_periodic
         )
 
-        # generate boundaries
-        bound_coords = np.append(0.0, np.cumsum(np.concatenate(dl_list)))
+        # generate boundaries, accumulating the steps in place in a single buffer
+        bound_coords = np.empty(sum(dl.size for dl in dl_list) + 1, dtype=np.float64)
+        bound_coords[0] = 0.0
+        np.concatenate(dl_list, out=bound_coords[1:])
+        np.cumsum(bound_coords[1:], out=bound_coords[1:])
         bound_coords += interval_coords[0]
 
         # fix simulation domain boundaries which may be slightly off
@@ -440,7 +533,7 @@ class AutoGrid(GridSpec1d):
             )
         bound_coords[[0, -1]] = domain_bounds
 
-        return np.array(bound_coords)
+        return bound_coords
 
 
 GridType = Union[UniformGrid, CustomGrid, AutoGrid]
@@ -516,17 +609,17 @@ class GridSpec(Tidy3dBaseModel):
         "uses :class:`.AutoGrid`.",
     )
 
-    @property
+    @cached_property
     def auto_grid_used(self) -> bool:
         """True if any of the three dimensions uses :class:`.AutoGrid`."""
         grid_list = [self.grid_x, self.grid_y, self.grid_z]
-        return np.any([isinstance(mesh, AutoGrid) for mesh in grid_list])
+        return any(isinstance(mesh, AutoGrid) for mesh in grid_list)
 
-    @property
+    @cached_property
     def custom_grid_used(self) -> bool:
         """True if any of the three dimensions uses :class:`.CustomGrid`."""
         grid_list = [self.grid_x, self.grid_y, self.grid_z]
-        return np.any([isinstance(mesh, CustomGrid) for mesh in grid_list])
+        return any(isinstance(mesh, CustomGrid) for mesh in grid_list)
 
     @staticmethod
     def wavelength_from_sources(sources: List[SourceType]) -> pd.PositiveFloat:
@@ -540,16 +633,19 @@ class GridSpec(Tidy3dBaseModel):
             )
 
         # Use central frequency of sources, if any.
-        freqs = np.array([source.source_time.freq0 for source in sources])
+        freq0 = sources[0].source_time.freq0
 
         # multiple sources of different central frequencies
-        if not np.all(np.isclose(freqs, freqs[0])):
+        if not all(
+            isclose(source.source_time.freq0, freq0, rel_tol=1e-5, abs_tol=1e-8)
+            for source in sources[1:]
+        ):
             raise SetupError(
                 "Sources of different central frequencies are supplied. "
                 "Please supply a 'wavelength' value for 'grid_spec'."
             )
 
-        return C_0 / freqs[0]
+        return C_0 / freq0
 
     @property
     def override_structures_used(self) -> List[bool, bool, bool]:
@@ -608,11 +704,13 @@ class GridSpec(Tidy3dBaseModel):
             wavelength = self.wavelength_from_sources(sources)
             log.info(f"Auto meshing using wavelength {wavelength:1.4f} defined from sources.")
 
+        grids_1d = [self.grid_x, self.grid_y, self.grid_z]
+
         # Warn user if ``GridType`` along some axis is not ``AutoGrid`` and
         # ``override_structures`` is not empty. The override structures
         # are not effective along those axes.
         for axis_ind, override_used_axis, grid_axis in zip(
-            ["x", "y", "z"], self.override_structures_used, [self.grid_x, self.grid_y, self.grid_z]
+            ["x", "y", "z"], self.override_structures_used, grids_1d
         ):
             if override_used_axis and not isinstance(grid_axis, AutoGrid):
                 log.warning(
@@ -622,16 +720,27 @@ class GridSpec(Tidy3dBaseModel):
                     capture=False,
                 )
 
-        grids_1d = [self.grid_x, self.grid_y, self.grid_z]
+        # the structure list is the same along all axes, so only assemble it once
+        all_structures = list(structures) + list(self.override_structures)
+
+        # same for the structures reduced to the symmetry domain used by ``AutoGrid``
+        symmetry_structures = None
+        if self.auto_grid_used:
+            symmetry_structures = AutoGrid._structures_in_symmetry_domain(all_structures, symmetry)
+
+        # Note: the axes are independent, but they are generated sequentially on purpose. The
+        # meshing is mostly pure-Python work holding the GIL, and it logs through the global
+        # ``log`` consolidation and validation capture state, which is not thread-safe.
         coords_dict = {}
         for idim, (dim, grid_1d) in enumerate(zip("xyz", grids_1d)):
-            coords_dict[dim] = grid_1d.make_coords(
+            coords_dict[dim] = grid_1d._make_coords(
                 axis=idim,
-                structures=list(structures) + list(self.override_structures),
+                structures=all_structures,
                 symmetry=symmetry,
                 periodic=periodic[idim],
                 wavelength=wavelength,
                 num_pml_layers=num_pml_layers[idim],
+                symmetry_structures=symmetry_structures,
             )
 
         coords = Coords(**coords_dict)
@@ -461,15 +461,10 @@ class GradedMesher(Mesher):
             A list of the bounding boxes of shape ``(2, 3)`` for each structure, with the bounds
             along ``axis`` being ``(:, 2)``.
         """
-        struct_bbox = []
-        for structure in structures:
-            # Get 3D bounding box and rotate axes
-            bmin, bmax = structure.geometry.bounds
-            bmin_ax, bmin_plane = structure.geometry.pop_axis(bmin, axis=axis)
-            bmax_ax, bmax_plane = structure.geometry.pop_axis(bmax, axis=axis)
-            bounds = np.array([list(bmin_plane) + [bmin_ax], list(bmax_plane) + [bmax_ax]])
-            struct_bbox.append(bounds)
-        return struct_bbox
+        # Get 3D bounding boxes of all structures at once and rotate axes
+        bounds = np.array([structure.geometry.bounds for structure in structures], dtype=float)
+        axes_rotated = [dim for dim in range(3) if dim != axis] + [axis]
+        return list(bounds[:, :, axes_rotated])
 
     @staticmethod
     def bounds_2d_tree(struct_bbox: List[ArrayFloat1D]):
@@ -793,7 +788,7 @@ class GradedMesher(Mesher):
         if grid_type == 0:
             even_dl = min(left_dl, right_dl)
             num_cells = int(np.ceil(len_interval / even_dl))
-            return np.array([len_interval / num_cells] * num_cells)
+            return np.full(num_cells, len_interval / num_cells)
 
         # grid_type = 1
         # We first set up grid steps from small to large, and then flip
@@ -874,8 +869,8 @@ class GradedMesher(Mesher):
         num_right_step = 1 + int(np.floor(np.log(max_dl / right_dl) / np.log(max_scale)))
 
         # step list, in ascending order
-        dl_list_left = np.array([left_dl * max_scale**i for i in range(num_left_step)])
-        dl_list_right = np.array([right_dl * max_scale**i for i in range(num_right_step)])
+        dl_list_left = left_dl * max_scale ** np.arange(num_left_step)
+        dl_list_right = right_dl * max_scale ** np.arange(num_right_step)
 
         # length
         len_left = left_dl * (1 - max_scale**num_left_step) / (1 - max_scale)
@@ -883,7 +878,7 @@ class GradedMesher(Mesher):
 
         # remaining part for constant large_dl
         num_const_step = int(np.floor((len_interval - len_left - len_right) / max_dl))
-        dl_list_const = np.array([max_dl] * num_const_step)
+        dl_list_const = np.full(num_const_step, max_dl)
         len_const = num_const_step * max_dl
 
         # mismatch
@@ -943,7 +938,7 @@ class GradedMesher(Mesher):
             size_snapped = num_cells * even_dl
             if size_snapped < len_interval:
                 num_cells += 1
-            return np.array([len_interval / num_cells] * num_cells)
+            return np.full(num_cells, len_interval / num_cells)
 
         # The maximal number of steps for both sides to undershoot the interval,
         # assuming the last step size from both sides grow to the same size before
@@ -958,8 +953,8 @@ class GradedMesher(Mesher):
         num_right_step = max(int(np.floor(np.log(tmp_num_r) / np.log(max_scale))), 0)
 
         # step list, in ascending order
-        dl_list_left = np.array([left_dl * max_scale**i for i in range(num_left_step)])
-        dl_list_right = np.array([right_dl * max_scale**i for i in range(num_right_step)])
+        dl_list_left = left_dl * max_scale ** np.arange(num_left_step)
+        dl_list_right = right_dl * max_scale ** np.arange(num_right_step)
 
         # length
         len_left = left_dl * (1 - max_scale**num_left_step) / (1 - max_scale)
@@ -1029,12 +1024,12 @@ class GradedMesher(Mesher):
         """
         # steps for scaling
         num_scale_step = 1 + int(np.floor(np.log(large_dl / small_dl) / np.log(max_scale)))
-        dl_list_scale = np.array([small_dl * max_scale**i for i in range(num_scale_step)])
+        dl_list_scale = small_dl * max_scale ** np.arange(num_scale_step)
         len_scale = small_dl * (1 - max_scale**num_scale_step) / (1 - max_scale)
 
         # remaining part for constant large_dl
         num_const_step = int(np.floor((len_interval - len_scale) / large_dl))
-        dl_list_const = np.array([large_dl] * num_const_step)
+        dl_list_const = np.full(num_const_step, large_dl)
         len_const = large_dl * num_const_step
 
         # mismatch
@@ -1085,7 +1080,7 @@ class GradedMesher(Mesher):
         num_step = int(np.floor(np.log(tmp_step) / np.log(max_scale)))
 
         # assuming num_step grids and scaling = max_scale
-        dl_list = np.array([small_dl * max_scale**i for i in range(num_step)])
+        dl_list = small_dl * max_scale ** np.arange(num_step)
         size_snapped = small_dl * (1 - max_scale**num_step) / (1 - max_scale)
 
         # mismatch
@@ -1113,7 +1108,7 @@ class GradedMesher(Mesher):
         # For this case, duplicate the 1st step size.
         len_mismatch_even = len_interval - num_step * small_dl
         if isclose(len_mismatch_even, small_dl):
-            return np.array([small_dl] * (num_step + 1))
+            return np.full(num_step + 1, small_dl)
 
         if len_mismatch_even > small_dl:
 
@@ -1134,7 +1129,7 @@ class GradedMesher(Mesher):
             # convergence check based on pyroots API and manual evaluation of the function.
             if sol_scale.converged and abs(fun_scale(sol_scale.x0)) <= _ROOTS_TOL:
                 new_scale = sol_scale.x0
-                dl_list = np.array([small_dl * new_scale**i for i in range(num_step)])
+                dl_list = small_dl * new_scale ** np.arange(num_step)
                 dl_list = np.append(small_dl, dl_list)
                 return dl_list
             # if not converged, let's use the strategy below.